@@ -6,18 +6,266 @@ This script processes all PDF files in a folder by:
 1. Running pdf2JSON.py on each PDF file to extract form data
 2. Running create_instance.py on each generated JSON file to create ORKG instances
 
+Both scripts are imported once and called in-process, so no interpreter is
+spawned per file.
+
 Usage:
     python batch_process.py <folder_path>
 """
 
 import os
 import sys
-import subprocess
+import io
 import json
+import signal
+import hashlib
+import logging
+import contextlib
+import importlib.util
+import multiprocessing
+import threading
+from collections import deque
+from queue import Queue
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Iterator, List, Optional, Tuple
 import time
 
+logger = logging.getLogger(__name__)
+
+# Number of ORKG instances created concurrently; creation waits on HTTP round-trips
+INSTANCE_WORKERS = 16
+
+# Per-folder record of created instances, used to resume interrupted batches
+LEDGER_FILENAME = ".created_instances.json"
+
+# Threads used to check PDF headers before conversion starts
+PREFLIGHT_WORKERS = 8
+
+
+class _ThreadRoutedStdout:
+    """Stand-in for sys.stdout that sends each thread's output to its own capture buffer"""
+
+    _local = threading.local()
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class _OutputTail:
+    """Write target that keeps only the last lines of output, for error reports"""
+
+    def __init__(self, max_lines: int = 200):
+        self._lines = deque(maxlen=max_lines)
+        self._partial = ""
+        self._total_lines = 0
+
+    def write(self, text: str) -> int:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        self._total_lines += len(lines)
+        self._lines.extend(lines)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self) -> str:
+        dropped = self._total_lines - len(self._lines)
+        header = [f"... ({dropped} earlier lines omitted)"] if dropped else []
+        return "\n".join([*header, *self._lines, self._partial])
+
+
+_stdout_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def capture_stdout():
+    """Capture what the current thread prints without touching other threads' output.
+
+    Only the tail of the output is kept, so chatty scripts don't grow memory.
+    """
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _ThreadRoutedStdout):
+            sys.stdout = _ThreadRoutedStdout(sys.stdout)
+
+    buffer = _OutputTail()
+    _ThreadRoutedStdout._local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _ThreadRoutedStdout._local.buffer = None
+
+
+def load_script(script_path: Path) -> ModuleType:
+    """Import a script file as a module so its functions can be called in-process"""
+    module_name = script_path.stem
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    # The scripts import the `scripts` package relative to their own folder
+    script_dir = str(script_path.parent)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def conversion_timeout(pdf_size: int) -> float:
+    """Time limit in seconds for converting a PDF, scaled with its size in bytes"""
+    pdf_size_mb = pdf_size / (1024 * 1024)
+    return max(30, min(1800, 10 + pdf_size_mb * 5))
+
+
+# Extra seconds a conversion process gets past its time limit, for starting up
+# and importing pdf2JSON, before it is killed from the parent
+CONVERSION_GRACE = 15
+
+
+def is_pdf(pdf_path: Path) -> bool:
+    """Check the file starts with the PDF magic bytes, so empty or broken files are skipped"""
+    try:
+        with open(pdf_path, "rb") as f:
+            return f.read(5) == b"%PDF-"
+    except OSError:
+        return False
+
+
+def ledger_key(json_path: Path, template_id: str, orkg_host: str) -> str:
+    """Key a JSON export in the ledger by its content, its template and the ORKG server"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (orkg_host.rstrip("/"), template_id):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(json_path.read_bytes())
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def time_limit(seconds: float):
+    """Raise TimeoutError after `seconds`; only enforced in a main thread on POSIX.
+
+    SIGALRM is handled between Python bytecodes, so a call stuck inside C code
+    (e.g. a long fitz operation) is only interrupted once it returns; batch
+    conversions are also killed from the parent once past their deadline.
+    """
+    if (
+        not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise TimeoutError(f"timed out after {seconds:.0f} seconds")
+
+    previous_handler = signal.signal(signal.SIGALRM, on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def conversion_mp_context():
+    """Start method for the conversion processes.
+
+    Forking copies whatever locks other threads hold at that moment (stdout
+    capture, logging handlers, urllib3 pools of running creations), which can
+    deadlock a child, so workers are started from a clean process instead.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _init_convert_worker():
+    """Set up logging in a conversion process.
+
+    Handlers inherited from the parent are dropped, so their buffered output
+    is neither written twice nor added to. The extractor's per-PDF INFO lines
+    stay quiet, as they did when pdf2JSON ran as a captured subprocess; only
+    warnings and errors get through.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    # PDFFormExtractor resets its logger to INFO for every PDF, so a level set
+    # here would not stick
+    logging.disable(logging.INFO)
+
+
+def _discard_pool(executor: ProcessPoolExecutor):
+    """Shut down a process pool, killing conversions still running in it"""
+    # ProcessPoolExecutor has no public way to stop a busy worker
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def _convert_pdf(
+    script_path: str, pdf_path: str, timeout: Optional[float] = None
+) -> Tuple[Optional[str], str, Optional[str]]:
+    """Convert one PDF with pdf2JSON.convert; runs in the worker processes.
+
+    Returns (json_path, captured_stdout, error_message).
+    """
+    pdf2json = load_script(Path(script_path))
+    with capture_stdout() as output:
+        try:
+            if timeout is None:
+                json_path = pdf2json.convert(pdf_path)
+            else:
+                with time_limit(timeout):
+                    json_path = pdf2json.convert(pdf_path)
+        except Exception as e:
+            return None, output.getvalue(), str(e)
+    return (str(json_path) if json_path else None), output.getvalue(), None
+
+
+@dataclass(slots=True)
+class BatchResults:
+    """Counters and outcomes collected while processing a folder"""
+
+    total_pdfs: int = 0
+    pdf_success: int = 0
+    pdf_failed: int = 0
+    pdf_cached: int = 0
+    instance_success: int = 0
+    instance_failed: int = 0
+    instance_cached: int = 0
+    created_instances: List[dict] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
 
 class BatchProcessor:
     """Handles batch processing of PDF files to ORKG instances"""
@@ -36,156 +284,207 @@ class BatchProcessor:
                 f"create_instance.py not found at {self.create_instance_script}"
             )
 
-    def find_pdf_files(self, folder_path: str) -> List[Path]:
-        """Find all PDF files in the specified folder"""
-        folder = Path(folder_path)
-        if not folder.exists():
-            raise FileNotFoundError(f"Folder not found: {folder_path}")
+        # Import both scripts once instead of starting an interpreter per file
+        self.pdf2json = load_script(self.pdf2json_script)
+        self.create_instance = load_script(self.create_instance_script)
+
+        # One TemplateInstanceCreator per worker thread, so the ORKG connection
+        # is set up once per thread instead of once per file; all of them are
+        # kept to be closed when the batch is done
+        self._creators = threading.local()
+        self._all_creators = []
 
-        pdf_files = list(folder.glob("*.pdf"))
-        print(f"📁 Found {len(pdf_files)} PDF files in {folder_path}")
+        # Instances created by earlier runs, keyed by PDF file name
+        self._ledger_path = None
+        self._ledger = {}
+
+    def find_pdf_files(self, folder_path: str) -> List[Tuple[Path, os.stat_result]]:
+        """Find all PDF files in the specified folder, largest first, with their stat"""
+        # scandir reuses the directory entry types instead of stat-ing every
+        # file, and the suffix check also picks up upper-case ".PDF" files
+        try:
+            with os.scandir(folder_path) as entries:
+                pdf_files = [
+                    (Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.name.lower().endswith(".pdf") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Folder not found: {folder_path}") from None
+
+        # Start the biggest PDFs first so a large file doesn't finish last on its own
+        pdf_files.sort(key=lambda pdf_file: pdf_file[1].st_size, reverse=True)
+        logger.info(f"📁 Found {len(pdf_files)} PDF files in {folder_path}")
         return pdf_files
 
     def run_pdf2json(self, pdf_path: Path) -> Tuple[bool, Path]:
         """Run pdf2JSON.py on a single PDF file"""
-        print(f"\n🔄 Converting PDF to JSON: {pdf_path.name}")
+        logger.info(f"\n🔄 Converting PDF to JSON: {pdf_path.name}")
 
         try:
-            # Run pdf2JSON.py with the PDF file path as input
-            result = subprocess.run(
-                [sys.executable, str(self.pdf2json_script)],
-                input=str(pdf_path),
-                text=True,
-                capture_output=True,
-                timeout=300,  # 5 minute timeout
+            json_path, output, error = _convert_pdf(
+                str(self.pdf2json_script),
+                str(pdf_path),
+                conversion_timeout(pdf_path.stat().st_size),
             )
-
-            if result.returncode == 0:
-                # Check if JSON file was created
-                json_path = pdf_path.with_suffix(".json")
-                if json_path.exists():
-                    print(f"  ✅ Successfully created: {json_path.name}")
-                    return True, json_path
-                else:
-                    print(f"  ❌ JSON file not created for {pdf_path.name}")
-                    return False, None
-            else:
-                print(f"  ❌ Error converting {pdf_path.name}:")
-                print(f"    stdout: {result.stdout}")
-                print(f"    stderr: {result.stderr}")
-                return False, None
-
-        except subprocess.TimeoutExpired:
-            print(f"  ⏰ Timeout converting {pdf_path.name}")
-            return False, None
         except Exception as e:
-            print(f"  ❌ Exception converting {pdf_path.name}: {e}")
+            json_path, output, error = None, "", str(e)
+
+        return self._report_conversion(pdf_path, json_path, output, error)
+
+    def _report_conversion(
+        self,
+        pdf_path: Path,
+        json_path: Optional[str],
+        output: str,
+        error: Optional[str],
+    ) -> Tuple[bool, Path]:
+        """Print the outcome of a PDF conversion and return it as (success, json_path)"""
+        pdf_name = pdf_path.name
+        if error is not None:
+            logger.error(
+                f"  ❌ Exception converting {pdf_name}: {error}\n"
+                f"    stdout: {output}"
+            )
+            return False, None
+
+        if json_path and Path(json_path).exists():
+            json_path = Path(json_path)
+            logger.info(f"  ✅ Successfully created: {json_path.name}")
+            return True, json_path
+        else:
+            logger.error(
+                f"  ❌ JSON file not created for {pdf_name}\n"
+                f"    stdout: {output}"
+            )
             return False, None
 
     def run_create_instance(self, json_path: Path) -> Tuple[bool, str]:
         """Run create_instance.py on a single JSON file"""
-        print(f"\n🏗️  Creating ORKG instance from: {json_path.name}")
+        json_name = json_path.name
+        logger.info(f"\n🏗️  Creating ORKG instance from: {json_name}")
 
+        output = io.StringIO()
         try:
-            # Run create_instance.py with the JSON file path as input
-            result = subprocess.run(
-                [sys.executable, str(self.create_instance_script)],
-                input=str(json_path),
-                text=True,
-                capture_output=True,
-                timeout=600,  # 10 minute timeout
-            )
-
-            if result.returncode == 0:
-                # Try to extract instance ID from output
-                output_lines = result.stdout.split("\n")
-                instance_id = None
-
-                for line in output_lines:
-                    if "Instance ID:" in line:
-                        instance_id = line.split("Instance ID:")[-1].strip()
-                        break
-                    elif "Instance URL:" in line:
-                        # Extract ID from URL
-                        url = line.split("Instance URL:")[-1].strip()
-                        instance_id = url.split("/")[-1]
-                        break
+            # Call create_instance.create directly, keeping its console output quiet
+            with capture_stdout() as output:
+                instance_id = self.create_instance.create(
+                    str(json_path), self._get_creator()
+                )
 
-                if instance_id:
-                    print(f"  ✅ Successfully created instance: {instance_id}")
-                    return True, instance_id
-                else:
-                    print(f"  ⚠️  Instance created but ID not found in output")
-                    return True, "Unknown"
+            if instance_id:
+                logger.info(f"  ✅ Successfully created instance: {instance_id}")
+                return True, instance_id
             else:
-                print(f"  ❌ Error creating instance from {json_path.name}:")
-                print(f"    stdout: {result.stdout}")
-                print(f"    stderr: {result.stderr}")
+                logger.error(
+                    f"  ❌ Error creating instance from {json_name}:\n"
+                    f"    stdout: {output.getvalue()}"
+                )
                 return False, None
 
-        except subprocess.TimeoutExpired:
-            print(f"  ⏰ Timeout creating instance from {json_path.name}")
-            return False, None
         except Exception as e:
-            print(f"  ❌ Exception creating instance from {json_path.name}: {e}")
+            logger.error(
+                f"  ❌ Exception creating instance from {json_name}: {e}\n"
+                f"    stdout: {output.getvalue()}"
+            )
             return False, None
 
-    def process_folder(self, folder_path: str) -> dict:
+    def _get_creator(self):
+        """Return the TemplateInstanceCreator of the current thread, creating it on first use"""
+        creator = getattr(self._creators, "creator", None)
+        if creator is None:
+            creator = self.create_instance.TemplateInstanceCreator()
+            self._creators.creator = creator
+            self._all_creators.append(creator)
+        return creator
+
+    def _existing_json(
+        self, pdf_path: Path, pdf_stat: os.stat_result
+    ) -> Optional[Path]:
+        """Return the JSON of a PDF if an earlier run converted it and the PDF is unchanged"""
+        json_path = pdf_path.with_suffix(".json")
+        try:
+            if json_path.stat().st_mtime >= pdf_stat.st_mtime:
+                return json_path
+        except FileNotFoundError:
+            pass
+        return None
+
+    def _load_ledger(self, folder_path: str):
+        """Load the instances created by earlier runs on this folder"""
+        self._ledger_path = Path(folder_path) / LEDGER_FILENAME
+        try:
+            with open(self._ledger_path, "r", encoding="utf-8") as f:
+                self._ledger = json.load(f)
+        except FileNotFoundError:
+            self._ledger = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable {LEDGER_FILENAME}: {e}")
+            self._ledger = {}
+
+    def _record_instance(self, key: str, pdf_name: str, instance_id: str):
+        """Add a created instance to the ledger; callers hold the results lock"""
+        self._ledger[key] = {"pdf": pdf_name, "instance_id": instance_id}
+        tmp_path = self._ledger_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._ledger, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self._ledger_path)
+
+    def _log_file_header(self, index: int, total: int, pdf_name: str):
+        """Log the header that starts the output for one PDF"""
+        logger.info(f"\n{'─'*60}")
+        logger.info(f"📄 Processing {index}/{total}: {pdf_name}")
+        logger.info(f"{'─'*60}")
+
+    def process_folder(self, folder_path: str) -> BatchResults:
         """Process all PDF files in a folder"""
-        print(f"{'='*80}")
-        print(f"🚀 Starting batch processing of folder: {folder_path}")
-        print(f"{'='*80}")
+        logger.info(f"{'='*80}")
+        logger.info(f"🚀 Starting batch processing of folder: {folder_path}")
+        logger.info(f"{'='*80}")
 
         # Find all PDF files
         pdf_files = self.find_pdf_files(folder_path)
 
         if not pdf_files:
-            print("❌ No PDF files found in the specified folder")
-            return {"success": False, "processed": 0, "errors": ["No PDF files found"]}
+            logger.error("❌ No PDF files found in the specified folder")
+            return BatchResults(errors=["No PDF files found"])
 
         # Track results
-        results = {
-            "total_pdfs": len(pdf_files),
-            "pdf_conversions": {"success": 0, "failed": 0},
-            "instance_creations": {"success": 0, "failed": 0},
-            "created_instances": [],
-            "errors": [],
-        }
+        results = BatchResults(total_pdfs=len(pdf_files))
+        self._load_ledger(folder_path)
+
+        # Drop files that are not PDFs at all before paying for a conversion
+        with ThreadPoolExecutor(max_workers=PREFLIGHT_WORKERS) as executor:
+            valid = list(executor.map(is_pdf, (pdf_path for pdf_path, _ in pdf_files)))
+        for (pdf_path, _), pdf_ok in zip(pdf_files, valid):
+            if not pdf_ok:
+                logger.error(f"❌ Not a valid PDF file, skipping: {pdf_path.name}")
+                results.pdf_failed += 1
+                results.errors.append(f"Invalid PDF file {pdf_path.name}")
+        pdf_files = [pdf_file for pdf_file, pdf_ok in zip(pdf_files, valid) if pdf_ok]
 
         start_time = time.time()
 
-        # Process each PDF file
-        for i, pdf_path in enumerate(pdf_files, 1):
-            print(f"\n{'─'*60}")
-            print(f"📄 Processing {i}/{len(pdf_files)}: {pdf_path.name}")
-            print(f"{'─'*60}")
-
-            # Step 1: Convert PDF to JSON
-            conversion_success, json_path = self.run_pdf2json(pdf_path)
-
-            if conversion_success:
-                results["pdf_conversions"]["success"] += 1
-
-                # Step 2: Create ORKG instance from JSON
-                instance_success, instance_id = self.run_create_instance(json_path)
-
-                if instance_success:
-                    results["instance_creations"]["success"] += 1
-                    results["created_instances"].append(
-                        {
-                            "pdf": pdf_path.name,
-                            "json": json_path.name,
-                            "instance_id": instance_id,
-                        }
-                    )
-                else:
-                    results["instance_creations"]["failed"] += 1
-                    results["errors"].append(
-                        f"Failed to create instance from {json_path.name}"
-                    )
-            else:
-                results["pdf_conversions"]["failed"] += 1
-                results["errors"].append(f"Failed to convert PDF {pdf_path.name}")
+        # Run both stages concurrently: PDF parsing is local work while instance
+        # creation waits on ORKG, so converted files are handed over through a
+        # bounded queue that holds back conversion if creation falls behind
+        handoff = Queue(maxsize=4)
+        results_lock = threading.Lock()
+
+        convert_thread = threading.Thread(
+            target=self._convert_stage,
+            args=(pdf_files, handoff, results, results_lock),
+            name="pdf2json",
+        )
+        create_thread = threading.Thread(
+            target=self._create_stage,
+            args=(handoff, results, results_lock),
+            name="create_instance",
+        )
+        convert_thread.start()
+        create_thread.start()
+        convert_thread.join()
+        create_thread.join()
 
         # Calculate total processing time
         end_time = time.time()
@@ -196,39 +495,323 @@ class BatchProcessor:
 
         return results
 
-    def print_summary(self, results: dict, processing_time: float):
-        """Print processing summary"""
-        print(f"\n{'='*80}")
-        print(f"📊 BATCH PROCESSING SUMMARY")
-        print(f"{'='*80}")
+    def _convert_stage(
+        self,
+        pdf_files: List[Tuple[Path, os.stat_result]],
+        handoff: Queue,
+        results: BatchResults,
+        results_lock: threading.Lock,
+    ):
+        """Convert each PDF to JSON and hand successful conversions to the next stage"""
+        try:
+            total = len(pdf_files)
+            done = 0
+
+            # PDFs converted by an earlier run go straight to the creation stage
+            pdf_to_convert = []
+            for pdf_path, pdf_stat in pdf_files:
+                json_path = self._existing_json(pdf_path, pdf_stat)
+                if json_path is None:
+                    pdf_to_convert.append((pdf_path, pdf_stat))
+                    continue
+
+                done += 1
+                self._log_file_header(done, total, pdf_path.name)
+                logger.info(f"  ♻️  Using existing JSON: {json_path.name}")
+                with results_lock:
+                    results.pdf_cached += 1
+                handoff.put((pdf_path, json_path))
+
+            if not pdf_to_convert:
+                return
+
+            # PDF parsing is CPU-bound, so conversions run in separate processes
+            # (one per core) and are handed over in completion order. Each
+            # conversion gets a time limit scaled to the PDF size, and a crash
+            # or hang only fails the PDF that caused it.
+            workers = min(os.cpu_count() or 1, len(pdf_to_convert))
+            # Write out buffered log records before any worker process starts
+            for handler in logging.getLogger().handlers:
+                handler.flush()
+            conversions = self._convert_in_processes(pdf_to_convert, workers)
+            for i, (pdf_path, json_path, output, error) in enumerate(
+                conversions, done + 1
+            ):
+                pdf_name = pdf_path.name
+                self._log_file_header(i, total, pdf_name)
+
+                # Step 1: Convert PDF to JSON
+                logger.info(f"\n🔄 Converting PDF to JSON: {pdf_name}")
+                conversion_success, json_path = self._report_conversion(
+                    pdf_path, json_path, output, error
+                )
 
-        print(f"⏱️  Total processing time: {processing_time:.1f} seconds")
-        print(f"📄 Total PDF files: {results['total_pdfs']}")
+                with results_lock:
+                    if conversion_success:
+                        results.pdf_success += 1
+                    else:
+                        results.pdf_failed += 1
+                        results.errors.append(f"Failed to convert PDF {pdf_name}")
+
+                if conversion_success:
+                    handoff.put((pdf_path, json_path))
+        finally:
+            # Sentinel: no more files for the creation stage
+            handoff.put(None)
+
+    def _convert_in_processes(
+        self, pdf_to_convert: List[Tuple[Path, os.stat_result]], workers: int
+    ) -> Iterator[Tuple[Path, Optional[str], str, Optional[str]]]:
+        """Convert PDFs in worker processes, yielding
+        (pdf_path, json_path, captured_stdout, error_message) as each one finishes.
+
+        At most `workers` conversions are submitted at a time, so each starts
+        once submitted and its deadline can be enforced from here: a conversion
+        past it is killed along with its pool. A crashed worker breaks the pool
+        without telling which PDF caused it, so the PDFs that were in flight
+        are converted again one at a time and only one that crashes alone fails.
+        """
+        pending = deque(
+            (pdf_path, conversion_timeout(pdf_stat.st_size))
+            for pdf_path, pdf_stat in pdf_to_convert
+        )
+        suspects = deque()
+        running = {}  # future -> (pdf_path, time limit, deadline)
+        isolated = False  # whether a suspect is being converted on its own
+        executor = None
+
+        def submit(pdf_path: Path, timeout: float):
+            future = executor.submit(
+                _convert_pdf, str(self.pdf2json_script), str(pdf_path), timeout
+            )
+            deadline = time.monotonic() + timeout + CONVERSION_GRACE
+            running[future] = (pdf_path, timeout, deadline)
 
-        print(f"\n🔄 PDF to JSON Conversion:")
-        print(f"  ✅ Successful: {results['pdf_conversions']['success']}")
-        print(f"  ❌ Failed: {results['pdf_conversions']['failed']}")
+        try:
+            while pending or suspects or running:
+                if executor is None:
+                    executor = ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=conversion_mp_context(),
+                        initializer=_init_convert_worker,
+                    )
+                if suspects:
+                    if not running:
+                        submit(*suspects.popleft())
+                        isolated = True
+                else:
+                    while pending and len(running) < workers:
+                        submit(*pending.popleft())
+                        isolated = False
+
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                finished, _ = wait(
+                    running,
+                    timeout=max(0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED,
+                )
 
-        print(f"\n🏗️  ORKG Instance Creation:")
-        print(f"  ✅ Successful: {results['instance_creations']['success']}")
-        print(f"  ❌ Failed: {results['instance_creations']['failed']}")
+                crashed = False
+                for future in finished:
+                    try:
+                        json_path, output, error = future.result()
+                    except BrokenProcessPool:
+                        crashed = True
+                        continue
+                    except Exception as e:
+                        json_path, output, error = None, "", str(e)
+                    pdf_path, _, _ = running.pop(future)
+                    yield pdf_path, json_path, output, error
+
+                if crashed:
+                    _discard_pool(executor)
+                    executor = None
+                    in_flight = [
+                        (pdf_path, timeout) for pdf_path, timeout, _ in running.values()
+                    ]
+                    running.clear()
+                    if isolated:
+                        yield in_flight[0][0], None, "", "conversion process crashed"
+                    else:
+                        suspects.extend(in_flight)
+                    continue
+
+                now = time.monotonic()
+                expired = [
+                    future
+                    for future, (_, _, deadline) in running.items()
+                    if deadline <= now
+                ]
+                if not expired:
+                    continue
+                # A conversion stuck in C code can only be stopped by killing
+                # its process, which takes the pool down with it
+                _discard_pool(executor)
+                executor = None
+                for future in expired:
+                    pdf_path, timeout, _ = running.pop(future)
+                    yield pdf_path, None, "", f"timed out after {timeout:.0f} seconds"
+                # The other conversions were not at fault and start over
+                pending.extendleft(
+                    (pdf_path, timeout)
+                    for pdf_path, timeout, _ in reversed(running.values())
+                )
+                running.clear()
+        finally:
+            if executor is not None:
+                _discard_pool(executor)
+
+    def _create_stage(
+        self, handoff: Queue, results: BatchResults, results_lock: threading.Lock
+    ):
+        """Create an ORKG instance for each JSON file handed over by the conversion stage"""
+        # Creation is network-bound, so several instances are created at once;
+        # the semaphore caps in-flight work so the handoff queue keeps applying
+        # backpressure to the conversion stage
+        in_flight = threading.BoundedSemaphore(INSTANCE_WORKERS)
+        try:
+            with ThreadPoolExecutor(max_workers=INSTANCE_WORKERS) as executor:
+                while True:
+                    item = handoff.get()
+                    if item is None:
+                        break
+                    pdf_path, json_path = item
+
+                    in_flight.acquire()
+                    future = executor.submit(
+                        self._create_and_record,
+                        pdf_path,
+                        json_path,
+                        results,
+                        results_lock,
+                    )
+                    future.add_done_callback(lambda _: in_flight.release())
+        finally:
+            # Workers are done; close their run logs and cache connections
+            for creator in self._all_creators:
+                creator.close()
+            self._all_creators.clear()
+            self._creators = threading.local()
+
+    def _create_and_record(
+        self,
+        pdf_path: Path,
+        json_path: Path,
+        results: BatchResults,
+        results_lock: threading.Lock,
+    ):
+        """Create the ORKG instance for one JSON file and record the outcome"""
+        pdf_name = pdf_path.name
+
+        # A JSON export whose instance was created by an earlier run is skipped,
+        # whether the JSON was reused or the PDF was converted to the same content
+        try:
+            key = ledger_key(
+                json_path,
+                self.create_instance.TemplateInstanceCreator.template_id,
+                self.create_instance.ORKG_HOST,
+            )
+        except OSError as e:
+            logger.warning(f"⚠️  Could not read {json_path.name} for the ledger: {e}")
+            key = None
+        entry = self._ledger.get(key) if key else None
+        instance_id = entry.get("instance_id") if isinstance(entry, dict) else None
+        if instance_id:
+            logger.info(f"\n♻️  Instance for {pdf_name} already created: {instance_id}")
+            with results_lock:
+                results.instance_cached += 1
+                results.created_instances.append(
+                    {
+                        "pdf": pdf_name,
+                        "json": json_path.name,
+                        "instance_id": instance_id,
+                    }
+                )
+            return
+
+        # Step 2: Create ORKG instance from JSON
+        instance_success, instance_id = self.run_create_instance(json_path)
+
+        with results_lock:
+            if instance_success:
+                results.instance_success += 1
+                results.created_instances.append(
+                    {
+                        "pdf": pdf_name,
+                        "json": json_path.name,
+                        "instance_id": instance_id,
+                    }
+                )
+                if key:
+                    self._record_instance(key, pdf_name, instance_id)
+            else:
+                results.instance_failed += 1
+                results.errors.append(
+                    f"Failed to create instance from {json_path.name}"
+                )
 
-        if results["created_instances"]:
-            print(f"\n🎉 Successfully Created Instances:")
-            for instance in results["created_instances"]:
-                print(
+    def print_summary(self, results: BatchResults, processing_time: float):
+        """Print processing summary"""
+        # Collect the whole summary and log it as one record, so it is written
+        # in one go and never interleaves with other output
+        lines = []
+        lines.append(f"\n{'='*80}")
+        lines.append(f"📊 BATCH PROCESSING SUMMARY")
+        lines.append(f"{'='*80}")
+
+        lines.append(f"⏱️  Total processing time: {processing_time:.1f} seconds")
+        lines.append(f"📄 Total PDF files: {results.total_pdfs}")
+
+        lines.append(f"\n🔄 PDF to JSON Conversion:")
+        lines.append(f"  ✅ Successful: {results.pdf_success}")
+        lines.append(f"  ♻️  Reused existing JSON: {results.pdf_cached}")
+        lines.append(f"  ❌ Failed: {results.pdf_failed}")
+
+        lines.append(f"\n🏗️  ORKG Instance Creation:")
+        lines.append(f"  ✅ Successful: {results.instance_success}")
+        lines.append(f"  ♻️  Already created: {results.instance_cached}")
+        lines.append(f"  ❌ Failed: {results.instance_failed}")
+
+        if results.created_instances:
+            lines.append(f"\n🎉 Successfully Created Instances:")
+            for instance in results.created_instances:
+                lines.append(
                     f"  📄 {instance['pdf']} → {instance['json']} → {instance['instance_id']}"
                 )
 
-        if results["errors"]:
-            print(f"\n⚠️  Errors encountered:")
-            for error in results["errors"]:
-                print(f"  ❌ {error}")
+        if results.errors:
+            lines.append(f"\n⚠️  Errors encountered:")
+            for error in results.errors:
+                lines.append(f"  ❌ {error}")
 
         success_rate = (
-            results["instance_creations"]["success"] / results["total_pdfs"]
+            (results.instance_success + results.instance_cached) / results.total_pdfs
         ) * 100
-        print(f"\n📈 Overall success rate: {success_rate:.1f}%")
+        lines.append(f"\n📈 Overall success rate: {success_rate:.1f}%")
+
+        logger.info("\n".join(lines))
+
+
+class _BlockStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream buffer, except for errors"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging():
+    """Send log records to stdout in 64 KB blocks instead of one write per line"""
+    stream = open(
+        sys.stdout.fileno(), "w", buffering=64 * 1024, encoding="utf-8", closefd=False
+    )
+    handler = _BlockStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
 
 
 def main():
@@ -238,6 +821,8 @@ def main():
         print("Example: python batch_process.py pdf_files/")
         sys.exit(1)
 
+    setup_logging()
+
     folder_path = sys.argv[1]
 
     try:
@@ -245,15 +830,15 @@ def main():
         results = processor.process_folder(folder_path)
 
         # Exit with appropriate code
-        if results["instance_creations"]["success"] > 0:
-            print(f"\n🎉 Batch processing completed!")
+        if results.instance_success + results.instance_cached > 0:
+            logger.info(f"\n🎉 Batch processing completed!")
             sys.exit(0)
         else:
-            print(f"\n❌ Batch processing failed!")
+            logger.error(f"\n❌ Batch processing failed!")
             sys.exit(1)
 
     except Exception as e:
-        print(f"❌ Error during batch processing: {e}")
+        logger.error(f"❌ Error during batch processing: {e}")
         sys.exit(1)
 
 
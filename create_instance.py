@@ -11,8 +11,14 @@ import re
 import logging
 import uuid
 import os
+import sys
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from orkg import ORKG
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from scripts.config import ORKG_HOST, ORKG_USERNAME, ORKG_PASSWORD
 from scripts.mappings import (
     predicates_mapping,
@@ -24,6 +30,228 @@ from scripts.mappings import (
     url_literal_keys,
 )
 from scripts.NLPRunLogger import NLPRunLogger
+from scripts.ORKGCache import ORKGCache
+
+try:
+    # Optional faster JSON parser
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open to the ORKG host, shared by all clients in this process;
+# sized for the batch's creation threads each sending statements in parallel
+HTTP_POOL_SIZE = 64
+
+# (connect, read) timeout in seconds for every ORKG request, so a stalled
+# request fails its paper instead of blocking a creation worker indefinitely
+HTTP_TIMEOUT = (10, 120)
+
+# Files created at once by create_many; instance creation mostly waits on ORKG
+CREATE_WORKERS = 8
+
+# Statements of one subtemplate instance sent at once
+STATEMENT_WORKERS = 4
+
+# Answer cleaning patterns, in the order _clean_answer_text applies them:
+# "(e.g., ...)", "(i.g., ...)" and everything from "(i.e." on
+EXAMPLE_PARENTHETICAL_RES = (
+    re.compile(r"\(\s*e\.g\.,?[^)]*\)", re.IGNORECASE),
+    re.compile(r"\(\s*i\.g\.,?[^)]*\)", re.IGNORECASE),
+    re.compile(r"\(\s*i\.e\.,?.*", re.IGNORECASE),
+)
+# Unclosed "(e.g., ..." / "(i.g., ..." up to the end of the answer
+EXAMPLE_TAIL_RES = (
+    re.compile(r"\(e\.g\.,.*", re.IGNORECASE),
+    re.compile(r"\(i\.g\.,.*", re.IGNORECASE),
+)
+PARENTHETICAL_RE = re.compile(r"\(.*?\)")
+WHITESPACE_RE = re.compile(r"\s+")
+# Example text captured from "(e.g., ...)"
+EXAMPLE_RE = re.compile(r"\(\s*e\.g\.,?\s*([^)]*)\)", re.IGNORECASE)
+# First integer in a free-text count such as "12 participants"
+INTEGER_RE = re.compile(r"[-+]?\d+")
+
+# ANSI colors for console headings
+ANSI = {
+    "reset": "\033[0m",
+    "bold": "\033[1m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "yellow": "\033[33m",
+}
+
+
+class ORKGRetry(Retry):
+    """Retry policy for ORKG calls.
+    429/503 mean the request was not processed, so every method is resent.
+    Other gateway/server errors are only retried for idempotent methods: a
+    POST may already have created the object, and resending it would
+    duplicate the resource or statement.
+    """
+
+    SHED_LOAD_STATUSES = frozenset({429, 503})
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if (
+            status_code not in self.SHED_LOAD_STATUSES
+            and method.upper() not in Retry.DEFAULT_ALLOWED_METHODS
+        ):
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies HTTP_TIMEOUT to requests sent without a timeout.
+    Stands in for the ORKG client's own timeout adapter, which is bypassed
+    once its clients use HTTP_SESSION.
+    """
+
+    def send(self, request, **kwargs):
+        kwargs["timeout"] = kwargs.get("timeout") or HTTP_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def build_http_session() -> requests.Session:
+    """Build the pooled keep-alive session used for all ORKG API calls"""
+    session = requests.Session()
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        # Transient ORKG errors are retried on the kept-alive connection.
+        # Read errors are not retried since the server may already have
+        # created the object.
+        max_retries=ORKGRetry(
+            total=4,
+            read=0,
+            backoff_factor=0.25,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
+# One ORKG client per thread, reused across creators. In orkg 1.3.0 a client's
+# only per-call state is backend._append_slash, which every call this script
+# makes either sets to True (all add calls) or only reads (resources.get), so
+# sharing would be safe today; a client per thread keeps one thread's calls
+# from ever depending on another's, e.g. if a call that sets it to False
+# (statements.bundle, literals.get_all) is added later
+_clients = threading.local()
+
+
+def get_orkg_client() -> ORKG:
+    """Return this thread's ORKG client, signing in on first use"""
+    orkg = getattr(_clients, "orkg", None)
+    if orkg is None:
+        # With follow_location the client fetches every created object again
+        # through a bare requests.get (no pool, retry or timeout); the new ID
+        # is read from the Location header instead, see created_id
+        orkg = ORKG(
+            host=ORKG_HOST,
+            creds=(ORKG_USERNAME, ORKG_PASSWORD),
+            follow_location=False,
+        )
+        use_shared_http_session(orkg)
+        _clients.orkg = orkg
+        logger.info("✅ Connected to ORKG")
+    return orkg
+
+
+def use_shared_http_session(orkg: ORKG):
+    """Send a client's requests through HTTP_SESSION so connections are reused across clients"""
+    # The ORKG client talks to the API through hammock objects that each
+    # hold a reference to their own requests session
+    for name in ("core", "backend", "simcomp"):
+        endpoint = getattr(orkg, name, None)
+        if endpoint is None:
+            continue
+        HTTP_SESSION.headers.update(endpoint._session.headers)
+        endpoint._session = HTTP_SESSION
+
+
+def refresh_auth(orkg: ORKG):
+    """Renew the bearer token a long-lived client sends with its requests"""
+    # The client's API namespaces copy the access token once, when the client
+    # is built; get_access_token refreshes or signs in again once it expires
+    if orkg.session is None:
+        return
+    auth = {"Authorization": f"Bearer {orkg.session.get_access_token()}"}
+    for namespace in vars(orkg).values():
+        if "auth" in getattr(namespace, "__dict__", {}):
+            namespace.auth = auth
+
+
+# (resource_mapping_key, answer label) -> resource ID, flattened for single lookups
+RESOURCE_INDEX = {
+    (mapping_key, label): resource_id
+    for mapping_key, resource_map in resource_mappings.items()
+    for label, resource_id in resource_map.items()
+}
+
+# Same index keyed by lowercased label for case-insensitive matches; built in
+# reverse so the first label in mapping order wins, as with a scan over the map
+RESOURCE_INDEX_LOWER = {
+    (mapping_key, label.lower()): resource_id
+    for (mapping_key, label), resource_id in reversed(RESOURCE_INDEX.items())
+}
+
+
+# resource_mapping_key -> literal datatype (None for plain text) for answers stored as literals
+LITERAL_DATATYPES = {
+    key: (
+        "xsd:integer"
+        if key in integer_literal_keys
+        else "xsd:uri" if key in url_literal_keys else None
+    )
+    for key in literal_based_resource_mappings
+}
+
+
+# "Other/Comments" option labels, as a set for membership tests
+OTHER_COMMENT_LABELS = frozenset(list_of_other_comments)
+
+# Checkbox export values that carry no answer text of their own
+IGNORED_FIELD_VALUES = frozenset({"Yes", "Off", "", "None"})
+
+
+def created_id(response) -> str:
+    """Return the ID of the object an add call created, from its Location URL"""
+    return response.url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def object_not_found(result: Any, object_id: str) -> bool:
+    """Whether ORKG rejected a statement because its object does not exist.
+    Exceptions and 5xx responses say nothing about the object, and the
+    statement may even have been created, so they never count.
+    """
+    if isinstance(result, Exception) or not str(result.status_code).startswith("4"):
+        return False
+    content = result.content
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", "replace")
+    message = str(content).lower()
+    return object_id.lower() in message and (
+        "not found" in message or "does not exist" in message
+    )
+
+
+def resolve_resource(resource_mapping_key: str, answer: str) -> Optional[str]:
+    """Return the predefined resource ID for an answer, or None if it is not mapped"""
+    return RESOURCE_INDEX.get((resource_mapping_key, answer))
 
 
 class NLPRunLogger:
@@ -104,59 +332,64 @@ class NLPRunLogger:
 class TemplateInstanceCreator:
     """Creates template instances from JSON survey data"""
 
+    # Only per-connection state lives on instances; the constants below are shared
+    __slots__ = (
+        "run_logger",
+        "files_processed",
+        "run_id",
+        "orkg",
+        "_question_index",
+        "_literals",
+        "_cache",
+        "_cached_objects",
+    )
+
+    template_id = "R1544125"
+    target_class_id = "C121001"
+
+    # Static survey mappings, shared by every creator instead of bound per object
+    resource_mappings = resource_mappings
+    class_mappings = class_mappings
+    predicates = predicates_mapping
+
     def __init__(self):
         """Initialize ORKG connection"""
         # Create domain logger (file only)
+        self.run_logger = None
+        self.files_processed = 0
+        self._question_index = None
+        # (label, datatype) -> literal ID created earlier, shared across files
+        self._literals = {}
+        # Literals and 'Other' resources created by earlier runs
+        self._cache = ORKGCache(ORKG_HOST, os.path.dirname(os.path.abspath(__file__)))
+        # ID -> (kind, key, label) of objects taken from that cache, which may
+        # have been deleted from ORKG since
+        self._cached_objects = {}
+        self.start_run()
+
+        self.orkg = get_orkg_client()
+        self.run_logger.log("connect", "ok", host=ORKG_HOST)
+
+    def start_run(self):
+        """Start a new run log so each processed JSON file gets its own log file"""
+        if self.run_logger is not None:
+            self.run_logger.close()
         self.run_id = str(uuid.uuid4())[:8]
         self.run_logger = NLPRunLogger(
             self.run_id, os.path.dirname(os.path.abspath(__file__))
         )
 
-        self.orkg = ORKG(
-            host=ORKG_HOST,
-            creds=(ORKG_USERNAME, ORKG_PASSWORD),
-        )
-        print("✅ Connected to ORKG")
-        self.run_logger.log("connect", "ok", host=ORKG_HOST)
-
-        self.template_id = "R1544125"
-        self.target_class_id = "C121001"
-
-        self.resource_mappings = resource_mappings
-
-        self.predicates = predicates_mapping
-        self.question_mappings = self.build_question_mappings()
-
-    def build_question_mappings(self) -> Dict[str, str]:
-        """Build a mapping from question numbers to predicate IDs"""
-        mappings = {}
-
-        def extract_mappings(properties, parent_key=""):
-            for prop_id, prop_info in properties.items():
-                if isinstance(prop_info, dict) and "question_mapping" in prop_info:
-                    question_mapping = prop_info["question_mapping"]
-                    if isinstance(question_mapping, list):
-                        for q in question_mapping:
-                            mappings[q] = prop_id
-                    else:
-                        mappings[question_mapping] = prop_id
-
-                # Handle nested subtemplate properties
-                if (
-                    isinstance(prop_info, dict)
-                    and "subtemplate_properties" in prop_info
-                ):
-                    extract_mappings(prop_info["subtemplate_properties"], prop_id)
-
-        extract_mappings(self.predicates)
-
-        return mappings
+    def close(self):
+        """Close the run log and the object cache once the creator is done"""
+        if self.run_logger is not None:
+            self.run_logger.close()
+        self._cache.close()
 
     def load_json_data(self, json_file_path: str) -> Dict[str, Any]:
         """Load JSON data from file"""
         try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(json_file_path, "rb") as f:
+                data = json_loads(f.read())
             print(f"✅ Loaded JSON data from {json_file_path}")
             self.run_logger.log("json", "loaded", path=json_file_path)
             return data
@@ -209,13 +442,13 @@ class TemplateInstanceCreator:
                 either we have an answer and its not None because when answer is empty we also add non in pdf2JSON
                 or we have None and None is in the resource_mappings and None is selected in the options details which means None was in the options details itself
                 """
+                stripped = answer.strip()
                 if (
-                    answer
-                    and answer.strip()
-                    and answer.strip() not in ["None"]
+                    stripped
+                    and stripped != "None"
                     or (
-                        answer.strip() in ["None"]
-                        and "None" in resource_mappings[resource_mapping_key]
+                        stripped == "None"
+                        and (resource_mapping_key, "None") in RESOURCE_INDEX
                         and self.check_if_none_selected_in_options_details(
                             question_data
                         )
@@ -228,7 +461,7 @@ class TemplateInstanceCreator:
                         resource_mapping_key=resource_mapping_key,
                     )
                     # Do NOT split here. Splitting (comma_separated) is handled later per property.
-                    label, desc = self._split_label_and_example(answer.strip())
+                    label, desc = self._split_label_and_example(stripped)
                     answers.append({"label": label, "description": desc})
 
         # Extract from options details
@@ -236,15 +469,11 @@ class TemplateInstanceCreator:
             for option in question_data["options_details"]:
                 if option.get("is_selected"):
                     # Add label if it exists and is not empty
-                    if option.get("label") and option["label"].strip():
-                        answer_to_add = option["label"].strip()
+                    answer_to_add = (option.get("label") or "").strip()
+                    if answer_to_add:
                         if (
-                            answer_to_add
-                            and answer_to_add not in ["None"]
-                            or (
-                                answer_to_add in ["None"]
-                                and "None" in resource_mappings[resource_mapping_key]
-                            )
+                            answer_to_add != "None"
+                            or (resource_mapping_key, "None") in RESOURCE_INDEX
                         ):
                             self.run_logger.log(
                                 "options_details",
@@ -257,48 +486,46 @@ class TemplateInstanceCreator:
 
                     # Add field value if it exists and is meaningful
                     field_value = option.get("field_value", "")
+                    stripped = field_value.strip() if field_value else ""
                     if (
-                        field_value
-                        and field_value.strip()
-                        and field_value not in ["Yes", "Off", "", "None"]
+                        stripped
+                        and field_value not in IGNORED_FIELD_VALUES
                         # field value is not a number string
-                        and not field_value.strip().isdigit()
+                        and not stripped.isdigit()
                     ):
-                        label, desc = self._split_label_and_example(field_value.strip())
+                        label, desc = self._split_label_and_example(stripped)
                         answers.append({"label": label, "description": desc})
 
-        # Clean answers: remove any parenthetical (e.g., ...) fragments and normalize whitespace
+        # Clean answers: remove any parenthetical (e.g., ...) fragments and normalize
+        # whitespace, keeping the first of each non-blank label/description pair
+        options_details = question_data.get("options_details", [])
         cleaned_answers: List[Dict[str, str]] = []
+        seen = set()
         for raw in answers:
-            if not raw:
-                continue
-            # raw is dict
+            raw_label = raw["label"]
             answer_label_type_in_options_details = (
                 self._get_answer_label_type_in_options_details(
-                    raw.get("label", ""), question_data.get("options_details", [])
+                    raw_label, options_details
                 )
             )
             self.run_logger.log(
                 "options_details",
                 "answer",
-                answer=raw.get("label", ""),
+                answer=raw_label,
                 resource_mapping_key=resource_mapping_key,
                 answer_label_type_in_options_details=answer_label_type_in_options_details,
             )
             cleaned_label = self._clean_answer_text(
-                raw.get("label", ""), answer_label_type_in_options_details
+                raw_label, answer_label_type_in_options_details
             )
-            cleaned_desc = raw.get("description")
-            if cleaned_label:
-                candidate = {"label": cleaned_label, "description": cleaned_desc}
-                if candidate not in cleaned_answers:
-                    cleaned_answers.append(candidate)
-
-        # Filter out empty answers and return
-        filtered_answers = [
-            ans for ans in cleaned_answers if ans and ans.get("label", "").strip()
-        ]
-        return filtered_answers
+            cleaned_desc = raw["description"]
+            if cleaned_label.strip() and (cleaned_label, cleaned_desc) not in seen:
+                seen.add((cleaned_label, cleaned_desc))
+                cleaned_answers.append(
+                    {"label": cleaned_label, "description": cleaned_desc}
+                )
+
+        return cleaned_answers
 
     def _clean_answer_text(
         self, text: str, answer_label_type_in_options_details: str
@@ -310,29 +537,28 @@ class TemplateInstanceCreator:
             return text
         cleaned = text
         # Remove any parenthetical that starts with e.g. (handles (e.g ...), (e.g., ...))
-        cleaned = re.sub(r"\(\s*e\.g\.,?[^)]*\)", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\(\s*i\.g\.,?[^)]*\)", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\(\s*i\.e\.,?.*", "", cleaned, flags=re.IGNORECASE)
+        for pattern in EXAMPLE_PARENTHETICAL_RES:
+            cleaned = pattern.sub("", cleaned)
 
         # Remove everything after we see (e.g.... not even care about the closing bracket only "(", "e", ".", "g"
         # Example: "Open source libraries/software (e.g., python libraries, ..." => "Open source libraries/software"
-        cleaned = re.sub(r"\(e\.g\.,.*", "", cleaned, flags=re.IGNORECASE).strip()
-        cleaned = re.sub(r"\(i\.g\.,.*", "", cleaned, flags=re.IGNORECASE).strip()
+        for pattern in EXAMPLE_TAIL_RES:
+            cleaned = pattern.sub("", cleaned).strip()
         # Delete every text in parenthesis
-        cleaned = re.sub(r"\(.*?\)", "", cleaned, flags=re.IGNORECASE).strip()
+        cleaned = PARENTHETICAL_RE.sub("", cleaned).strip()
 
         # # delete the space between "ex1 / ex2" => "ex1/ex2"
         # cleaned = re.sub(r"\s*/\s*", "/", cleaned)
 
         # Also remove stray multiple spaces and trailing commas
-        cleaned = re.sub(r"\s+", " ", cleaned).strip().strip(",")
+        cleaned = WHITESPACE_RE.sub(" ", cleaned).strip().strip(",")
         return cleaned
 
     def _split_label_and_example(self, text: str) -> (str, Optional[str]):
         """Return (label, example_text) where example_text captures (e.g., ...) content if present."""
         if not isinstance(text, str):
             return text, None
-        match = re.search(r"\(\s*e\.g\.,?\s*([^)]*)\)", text, flags=re.IGNORECASE)
+        match = EXAMPLE_RE.search(text)
         example = None
         if match:
             example = match.group(1).strip()
@@ -346,12 +572,27 @@ class TemplateInstanceCreator:
         self, questions: List[Dict], question_id: str
     ) -> Optional[Dict]:
         """Find a question by its ID pattern (e.g., 'I.1', 'II.1', etc.)"""
+        if question_id.count(".") == 1:
+            return self._index_questions(questions).get(question_id)
+
         for question in questions:
             question_text = question.get("question_text", "")
             if question_text.startswith(f"{question_id}."):
                 return question
         return None
 
+    def _index_questions(self, questions: List[Dict]) -> Dict[str, Dict]:
+        """Index questions by their 'section.number' prefix, once per questions list"""
+        if self._question_index is None or self._question_index[0] is not questions:
+            index = {}
+            for question in questions:
+                # "III.1. What is ..." -> "III.1"; keep the first question per prefix
+                parts = question.get("question_text", "").split(".", 2)
+                if len(parts) == 3:
+                    index.setdefault(f"{parts[0]}.{parts[1]}", question)
+            self._question_index = (questions, index)
+        return self._question_index[1]
+
     def map_answer_to_resource(
         self,
         answer: str,
@@ -364,15 +605,16 @@ class TemplateInstanceCreator:
         if resource_mapping_key not in self.resource_mappings:
             return None
 
-        resource_map = self.resource_mappings[resource_mapping_key]
-
         # Try exact match first
-        if answer in resource_map:
-            return resource_map[answer]
+        resource_id = resolve_resource(resource_mapping_key, answer)
+        if resource_id is not None:
+            return resource_id
 
+        answer_lower = answer.lower()
+        answer_key = answer.strip().lower()
         if (
-            prev_answer.strip().lower() in list_of_other_comments
-            and answer.strip().lower() not in list_of_other_comments
+            prev_answer.strip().lower() in OTHER_COMMENT_LABELS
+            and answer_key not in OTHER_COMMENT_LABELS
         ):
             # Skip creating resources for contextual 'Other/Comments'
             try:
@@ -387,17 +629,16 @@ class TemplateInstanceCreator:
             return self.create_new_resource_for_other(answer, resource_mapping_key)
 
         # Try case-insensitive match
-        for key, value in resource_map.items():
-            if key.lower() == answer.lower():
-                return value
+        resource_id = RESOURCE_INDEX_LOWER.get((resource_mapping_key, answer_lower))
+        if resource_id is not None:
+            return resource_id
 
         # Avoid partial matches to prevent wrong class/resource links
 
         # Handle "Other/Comments" case - do not create any resource; skip
-        answer_lower = answer.lower()
         if "other" in answer_lower or "comment" in answer_lower:
             # Check if this is just "Other/Comments" or has additional text
-            if answer.strip().lower() in list_of_other_comments:
+            if answer_key in OTHER_COMMENT_LABELS:
                 try:
                     self.run_logger.log(
                         "unmapped",
@@ -409,14 +650,11 @@ class TemplateInstanceCreator:
                     pass
                 if is_last_answer and allowed_to_add_not_reported:
                     # Just "Other/Comments" without specific text - use "Unknown"
-                    if (
-                        resource_mapping_key in self.resource_mappings
-                        and "Not reported"
-                        in self.resource_mappings[resource_mapping_key]
-                    ):
-                        return self.resource_mappings[resource_mapping_key][
-                            "Not reported"
-                        ]
+                    not_reported_id = resolve_resource(
+                        resource_mapping_key, "Not reported"
+                    )
+                    if not_reported_id is not None:
+                        return not_reported_id
                     else:
                         return self.create_new_resource_for_other(
                             "Not reported", resource_mapping_key
@@ -435,8 +673,24 @@ class TemplateInstanceCreator:
         """Create a new resource for 'Other/Comments' answers"""
         try:
             # Get the appropriate class for this resource type
-            if resource_mapping_key in class_mappings:
-                class_id = class_mappings[resource_mapping_key]
+            class_id = self.class_mappings.get(resource_mapping_key)
+            if class_id is not None:
+                # Reuse the resource an earlier run created for this answer
+                resource_id = self._cache.get("resource", resource_mapping_key, answer)
+                if resource_id is not None:
+                    self._cached_objects[resource_id] = (
+                        "resource",
+                        resource_mapping_key,
+                        answer,
+                    )
+                    self.run_logger.log(
+                        "resource",
+                        "reused",
+                        label=answer,
+                        class_id=class_id,
+                        id=resource_id,
+                    )
+                    return resource_id
 
                 # Create new resource
                 resource_response = self.orkg.resources.add(
@@ -444,7 +698,8 @@ class TemplateInstanceCreator:
                 )
 
                 if resource_response.succeeded:
-                    resource_id = resource_response.content["id"]
+                    resource_id = created_id(resource_response)
+                    self._cache.put("resource", resource_mapping_key, answer, resource_id)
                     self.run_logger.log(
                         "resource",
                         "created",
@@ -471,10 +726,10 @@ class TemplateInstanceCreator:
             if not answer:
                 continue
 
-            is_other_comment = answer.strip() in list_of_other_comments
+            is_other_comment = answer.strip() in OTHER_COMMENT_LABELS
             is_disallowed_none = (
                 answer.strip() == "None"
-                and "None" not in resource_mappings[resource_mapping_key]
+                and (resource_mapping_key, "None") not in RESOURCE_INDEX
             )
 
             if not is_other_comment and not is_disallowed_none:
@@ -482,13 +737,13 @@ class TemplateInstanceCreator:
                 break
 
         # Do not allow creating new categorical resources when not explicitly mapped
-        for answer_obj in answers:
+        last_index = len(answers) - 1
+        for index, answer_obj in enumerate(answers):
             # answer_obj is dict with keys: label, description
             answer = answer_obj.get("label", "")
             example_desc = answer_obj.get("description")
             # First try to map to existing resource
-            index = answers.index(answer_obj)
-            is_last_answer = index == len(answers) - 1
+            is_last_answer = index == last_index
             prev_answer = answers[index - 1].get("label", "")
             resource_id = self.map_answer_to_resource(
                 answer, resource_mapping_key, is_last_answer, prev_answer, allowed_to_add_not_reported
@@ -504,7 +759,7 @@ class TemplateInstanceCreator:
 
             if resource_id:
                 result_ids.append(resource_id)
-                print(f"  ✅ Mapped '{answer}' to resource: {resource_id}")
+                logger.debug("  ✅ Mapped '%s' to resource: %s", answer, resource_id)
                 self.run_logger.log(
                     "map",
                     "to_resource",
@@ -514,25 +769,22 @@ class TemplateInstanceCreator:
                 )
             else:
                 # Create literal for text-based answers or unmapped answers
-                if resource_mapping_key in literal_based_resource_mappings:
+                if resource_mapping_key in LITERAL_DATATYPES:
                     # These should be literals
+                    datatype = LITERAL_DATATYPES[resource_mapping_key]
                     try:
                         # Integer literal handling for specific keys
-                        if resource_mapping_key in integer_literal_keys:
-                            import re as _re
-
-                            match = _re.search(r"[-+]?\\d+", str(answer))
+                        if datatype == "xsd:integer":
+                            match = INTEGER_RE.search(str(answer))
                             if match:
                                 int_value = match.group(0)
-                                literal_response = self.orkg.literals.add(
-                                    label=int_value, datatype="xsd:integer"
-                                )
+                                literal_id = self.add_literal(int_value, datatype)
                                 self.run_logger.log(
                                     "Integer literal",
                                     "created",
                                     key=resource_mapping_key,
                                     answer=answer,
-                                    id=literal_response.content["id"],
+                                    id=literal_id,
                                 )
                             else:
                                 self.run_logger.log(
@@ -542,20 +794,14 @@ class TemplateInstanceCreator:
                                     answer=answer,
                                 )
                                 # Fallback to text literal if no integer could be parsed
-                                literal_response = self.orkg.literals.add(
-                                    label=int(answer), datatype="xsd:integer"
-                                )
-                        elif resource_mapping_key in url_literal_keys:
-                            literal_response = self.orkg.literals.add(
-                                label=answer, datatype="xsd:uri"
-                            )
+                                literal_id = self.add_literal(int(answer), datatype)
                         else:
-
-                            literal_response = self.orkg.literals.add(label=answer)
-                        if literal_response.succeeded:
-                            literal_id = literal_response.content["id"]
+                            literal_id = self.add_literal(answer, datatype)
+                        if literal_id:
                             result_ids.append(literal_id)
-                            print(f"  ✅ Created literal for '{answer}': {literal_id}")
+                            logger.debug(
+                                "  ✅ Created literal for '%s': %s", answer, literal_id
+                            )
                             # Log literal creation for traceability
                             self.run_logger.log(
                                 "literal",
@@ -573,8 +819,8 @@ class TemplateInstanceCreator:
                     )
                     if resource_id:
                         result_ids.append(resource_id)
-                        print(
-                            f"  ✅ Created new resource for '{answer}': {resource_id}"
+                        logger.debug(
+                            "  ✅ Created new resource for '%s': %s", answer, resource_id
                         )
                         self.run_logger.log(
                             "unmapped",
@@ -621,14 +867,11 @@ class TemplateInstanceCreator:
         # If no explicit mapping, try to find question based on description
         if not question_mapping:
             description = property_info.get("description", "").lower()
+            keywords = [keyword for keyword in description.split() if len(keyword) > 3]
             # Try to find matching question by description keywords
             for question in questions:
                 question_text = question.get("question_text", "").lower()
-                if any(
-                    keyword in question_text
-                    for keyword in description.split()
-                    if len(keyword) > 3
-                ):
+                if any(keyword in question_text for keyword in keywords):
                     all_answers = self.extract_answer_from_question(
                         question, property_info.get("resource_mapping_key")
                     )
@@ -674,40 +917,33 @@ class TemplateInstanceCreator:
         # Handle comma separation only when explicitly specified
         if property_info.get("comma_separated", True):
             expanded_answers = []
+            append = expanded_answers.append
             for answer in all_answers:
                 if type(answer) == dict:
-                    answer_text = answer.get("label", "")
                     # Keep the dictionary format for create_literal_or_resource
-                    if "," in answer_text and len(answer_text.split(",")) > 1:
-                        for sub_answer in answer_text.split(","):
+                    parts = answer.get("label", "").split(",")
+                    if len(parts) > 1:
+                        description = answer.get("description")
+                        for sub_answer in parts:
                             sub_answer = sub_answer.strip()
                             if sub_answer:
-                                expanded_answers.append(
-                                    {
-                                        "label": sub_answer,
-                                        "description": answer.get("description"),
-                                    }
-                                )
+                                append({"label": sub_answer, "description": description})
                     else:
-                        expanded_answers.append(answer)
+                        append(answer)
                 elif type(answer) == str:
                     # Handle string answers
-                    if "," in answer and len(answer.split(",")) > 1:
-                        for sub_answer in answer.split(","):
-                            # TODO: if sub_answer is the last index and it contains "and" remove the "and"
-                            index = answer.split(",").index(sub_answer)
-                            if (
-                                index == len(answer.split(",")) - 1
-                                and "and" in sub_answer
-                            ):
+                    parts = answer.split(",")
+                    if len(parts) > 1:
+                        last = len(parts) - 1
+                        for index, sub_answer in enumerate(parts):
+                            # Drop the "and" joining the last item of the list
+                            if index == last and "and" in sub_answer:
                                 sub_answer = sub_answer.replace("and", "")
                             sub_answer = sub_answer.strip()
                             if sub_answer:
-                                expanded_answers.append(
-                                    {"label": sub_answer, "description": None}
-                                )
+                                append({"label": sub_answer, "description": None})
                     else:
-                        expanded_answers.append({"label": answer, "description": None})
+                        append({"label": answer, "description": None})
                 else:
                     raise ValueError(f"  ❌ Invalid answer type: {type(answer)}")
             all_answers = expanded_answers
@@ -753,38 +989,35 @@ class TemplateInstanceCreator:
         return result_ids  # Return all IDs to handle multiple answers
 
     def add_not_reported(self, mapping_key: str, instance_id: str, prop_id: str):
-        if (
-            mapping_key in self.resource_mappings
-            and "Not reported" in self.resource_mappings[mapping_key]
-        ):
-            not_reported_id = self.resource_mappings[mapping_key]["Not reported"]
+        not_reported_id = resolve_resource(mapping_key, "Not reported")
+        if not_reported_id is not None:
             self.orkg.statements.add(
                 subject_id=instance_id,
                 predicate_id=prop_id,
                 object_id=not_reported_id,
             )
-            print(
-                f"    ✅ Added property {prop_id} with value {not_reported_id} (Not reported)"
+            logger.debug(
+                "    ✅ Added property %s with value %s (Not reported)",
+                prop_id,
+                not_reported_id,
             )
         else:
             # If not reported mapping is missing, create a text literal 'Not reported'
             try:
-                lit = self.orkg.literals.add(label="Not reported")
-                if lit.succeeded:
-                    self.orkg.statements.add(
-                        subject_id=instance_id,
-                        predicate_id=prop_id,
-                        object_id=lit.content["id"],
-                    )
-                    print(
-                        f"    ✅ Added property {prop_id} with text literal 'Not reported'"
+                literal_id = self.add_literal("Not reported")
+                if literal_id:
+                    # Through add_statements, so a stale cached literal is replaced
+                    self.add_statements([(instance_id, prop_id, literal_id)])
+                    logger.debug(
+                        "    ✅ Added property %s with text literal 'Not reported'",
+                        prop_id,
                     )
                     self.run_logger.log(
                         "literal",
                         "created",
                         key=mapping_key,
                         answer="Not reported",
-                        id=lit.content["id"],
+                        id=literal_id,
                     )
                 else:
                     print(f"    ⚠️ No data found - skipping field")
@@ -826,7 +1059,7 @@ class TemplateInstanceCreator:
                 # Try creating without class specification as fallback
                 retry_response = self.orkg.resources.add(label=label, classes=[])
                 if retry_response.succeeded:
-                    instance_id = retry_response.content["id"]
+                    instance_id = created_id(retry_response)
                     print(
                         f"  ✅ Created subtemplate instance without class specification: {instance_id}"
                     )
@@ -836,14 +1069,16 @@ class TemplateInstanceCreator:
                     )
                     return None
             else:
-                instance_id = instance_response.content["id"]
+                instance_id = created_id(instance_response)
                 print(f"  ✅ Created subtemplate instance: {instance_id}")
 
                 # Note: Subtemplates already exist in ORKG, no need to materialize
-                print(f"    ✅ Using existing subtemplate {subtemplate_id}")
+                logger.debug("    ✅ Using existing subtemplate %s", subtemplate_id)
 
-            # Process subtemplate properties
+            # Process subtemplate properties; their statements are collected
+            # and sent together once all values are resolved
             subtemplate_properties = subtemplate_info.get("subtemplate_properties", {})
+            statements = []
             # Visual divider before listing properties in console
             print("    " + "─" * 56)
             for prop_id, prop_info in subtemplate_properties.items():
@@ -857,12 +1092,8 @@ class TemplateInstanceCreator:
                         )
                         if nested_instance_id:
                             # Link nested instance
-                            self.orkg.statements.add(
-                                subject_id=instance_id,
-                                predicate_id=prop_id,
-                                object_id=nested_instance_id,
-                            )
-                            print(f"    ✅ Linked nested subtemplate {prop_id}")
+                            statements.append((instance_id, prop_id, nested_instance_id))
+                            logger.debug("    ✅ Linked nested subtemplate %s", prop_id)
                     else:
                         # Handle regular property
                         result_ids = self.process_property(
@@ -874,13 +1105,11 @@ class TemplateInstanceCreator:
                                 result_ids = [result_ids]
 
                             for result_id in result_ids:
-                                self.orkg.statements.add(
-                                    subject_id=instance_id,
-                                    predicate_id=prop_id,
-                                    object_id=result_id,
-                                )
-                            print(
-                                f"    ✅ Added property {prop_id} with {len(result_ids)} value(s)"
+                                statements.append((instance_id, prop_id, result_id))
+                            logger.debug(
+                                "    ✅ Added property %s with %d value(s)",
+                                prop_id,
+                                len(result_ids),
                             )
                             self.run_logger.log(
                                 "property",
@@ -899,6 +1128,16 @@ class TemplateInstanceCreator:
                                 continue
                             # if prop_id exists in resource_mappings and the value is "Not reported", then use the mapped resource ID
                             self.add_not_reported(mapping_key, instance_id, prop_id)
+            # A failed statement only loses that value; the subtemplate is still
+            # returned so it gets linked to the main instance
+            results = self.add_statements(statements)
+            for (_, prop_id, object_id), result in zip(statements, results):
+                if isinstance(result, Exception):
+                    print(f"  ⚠️ Error adding {prop_id} to subtemplate {label}: {result}")
+                elif not result.succeeded:
+                    print(
+                        f"  ⚠️ Failed to add {prop_id} -> {object_id} to subtemplate {label}: {result.content}"
+                    )
             # Run log: subtemplate end and closing divider
             self.run_logger.log(
                 "subtemplate",
@@ -915,6 +1154,79 @@ class TemplateInstanceCreator:
             print(f"  ❌ Error creating subtemplate: {e}")
             return None
 
+    def add_statements(self, statements: List[Tuple[str, str, str]]) -> List[Any]:
+        """Add (subject, predicate, object) statements with several requests in flight.
+        Returns the response, or the raised exception, for each statement in order.
+        """
+
+        def add(statement: Tuple[str, str, str]):
+            subject_id, predicate_id, object_id = statement
+            try:
+                return self.orkg.statements.add(
+                    subject_id=subject_id,
+                    predicate_id=predicate_id,
+                    object_id=object_id,
+                )
+            except Exception as e:
+                return e
+
+        # ORKG has no bulk statement endpoint. In orkg 1.3.0 statements.add only
+        # sets backend._append_slash = True before posting, so concurrent adds on
+        # one client all write the same value and build the same URL; a call
+        # that sets it to False must not run alongside them.
+        if len(statements) <= 1:
+            results = [add(statement) for statement in statements]
+        else:
+            with ThreadPoolExecutor(max_workers=STATEMENT_WORKERS) as executor:
+                results = list(executor.map(add, statements))
+
+        # A cached object may have been deleted from ORKG since it was stored;
+        # when ORKG reports it missing, create it again and retry the
+        # statements that used it once
+        replaced = {}
+        for index, (subject_id, predicate_id, object_id) in enumerate(statements):
+            if not object_not_found(results[index], object_id):
+                continue
+            if object_id not in replaced and object_id in self._cached_objects:
+                replaced[object_id] = self.replace_cached_object(object_id)
+            new_id = replaced.get(object_id)
+            if new_id is not None:
+                results[index] = add((subject_id, predicate_id, new_id))
+        return results
+
+    def replace_cached_object(self, object_id: str) -> Optional[str]:
+        """Forget a cached object ORKG rejected and create it again, returning the new ID"""
+        kind, key, label = self._cached_objects.pop(object_id)
+        print(
+            f"  ♻️ Cached {kind} {object_id} for '{label}' was rejected; creating it again"
+        )
+        if kind == "literal":
+            self._cache.forget("literal", key or "", str(label))
+            self._literals.pop((label, key), None)
+            return self.add_literal(label, key)
+        self._cache.forget("resource", key, label)
+        return self.create_new_resource_for_other(label, key)
+
+    def add_literal(self, label: Any, datatype: Optional[str] = None) -> Optional[str]:
+        """Create a literal and return its ID, reusing one already made for the same value"""
+        key = (label, datatype)
+        literal_id = self._literals.get(key)
+        if literal_id is None:
+            literal_id = self._cache.get("literal", datatype or "", str(label))
+            if literal_id is not None:
+                self._cached_objects[literal_id] = ("literal", datatype, label)
+        if literal_id is None:
+            if datatype is None:
+                literal_response = self.orkg.literals.add(label=label)
+            else:
+                literal_response = self.orkg.literals.add(label=label, datatype=datatype)
+            if not literal_response.succeeded:
+                return None
+            literal_id = created_id(literal_response)
+            self._cache.put("literal", datatype or "", str(label), literal_id)
+        self._literals[key] = literal_id
+        return literal_id
+
     def create_literal_for_field(self, field_data: str) -> Optional[str]:
         """Create a literal with just the answer data"""
         if not field_data.strip():
@@ -922,11 +1234,10 @@ class TemplateInstanceCreator:
 
         try:
             # Create literal with just the clean answer data
-            literal_response = self.orkg.literals.add(label=field_data)
+            literal_id = self.add_literal(field_data)
 
-            if literal_response.succeeded:
-                literal_id = literal_response.content["id"]
-                print(f"  ✅ Created literal: {literal_id}")
+            if literal_id:
+                logger.debug("  ✅ Created literal: %s", literal_id)
                 return literal_id
             else:
                 print(f"  ❌ Failed to create literal")
@@ -1035,13 +1346,12 @@ class TemplateInstanceCreator:
                     "Contribution",
                 ],  # Use the target class directly
             )
-            print(instance_response.content)
-
             if not instance_response.succeeded:
+                print(instance_response.content)
                 print(f"❌ Failed to create instance")
                 return None
 
-            instance_id = instance_response.content["id"]
+            instance_id = created_id(instance_response)
             print(f"✅ Created instance: {instance_id}")
             # Update logger file name to include instance ID
             try:
@@ -1054,35 +1364,30 @@ class TemplateInstanceCreator:
                 "✅ Instance created with target class - should be linked to template"
             )
 
-            # ANSI colors for console headings
-            ANSI = {
-                "reset": "\033[0m",
-                "bold": "\033[1m",
-                "blue": "\033[34m",
-                "magenta": "\033[35m",
-                "cyan": "\033[36m",
-                "yellow": "\033[33m",
-            }
+            # Links from the main instance, sent together after all fields are
+            # processed: (predicate_id, object_id, is_subtemplate)
+            links = []
 
             # Process each predicate in the template
             for predicate_id, predicate_info in self.predicates.items():
+                label = predicate_info["label"]
                 # Run log section divider
                 self.run_logger.divider(f"PREDICATE {predicate_id}")
                 self.run_logger.log(
                     "section",
                     "predicate",
                     id=predicate_id,
-                    label=predicate_info["label"],
+                    label=label,
                 )
                 # Console heading with color
                 print(
-                    f"\n{ANSI['bold']}{ANSI['blue']}🔍 Processing: {predicate_info['label']} ({predicate_id}){ANSI['reset']}"
+                    f"\n{ANSI['bold']}{ANSI['blue']}🔍 Processing: {label} ({predicate_id}){ANSI['reset']}"
                 )
 
                 if "subtemplate_properties" in predicate_info:
                     # Handle subtemplate fields
                     print(
-                        f"{ANSI['magenta']}  📋 Creating subtemplate for {predicate_info['label']}{ANSI['reset']}"
+                        f"{ANSI['magenta']}  📋 Creating subtemplate for {label}{ANSI['reset']}"
                     )
                     subtemplate_id = self.create_subtemplate_instance_new(
                         predicate_info, json_data, paper_title
@@ -1090,29 +1395,7 @@ class TemplateInstanceCreator:
 
                     if subtemplate_id:
                         # Link the subtemplate instance to the main instance
-                        link_stmt = self.orkg.statements.add(
-                            subject_id=instance_id,
-                            predicate_id=predicate_id,
-                            object_id=subtemplate_id,
-                        )
-
-                        if link_stmt.succeeded:
-                            print(
-                                f"  ✅ Linked subtemplate to instance with predicate {predicate_id}"
-                            )
-                            # Log link creation
-                            try:
-                                self.run_logger.log(
-                                    "link",
-                                    "created",
-                                    s=instance_id,
-                                    p=predicate_id,
-                                    o=subtemplate_id,
-                                )
-                            except Exception:
-                                pass
-                        else:
-                            print(f"  ⚠️ Failed to link subtemplate to instance")
+                        links.append((predicate_id, subtemplate_id, True))
                     else:
                         print(f"  ⚠️ Failed to create subtemplate - skipping field")
                 else:
@@ -1128,49 +1411,20 @@ class TemplateInstanceCreator:
 
                         for result_id in result_ids:
                             # Link the result to the instance using the correct predicate
-                            try:
-                                link_stmt = self.orkg.statements.add(
-                                    subject_id=instance_id,
-                                    predicate_id=predicate_id,
-                                    object_id=result_id,
-                                )
-
-                                if link_stmt.succeeded:
-                                    print(
-                                        f"  ✅ Linked to instance with predicate {predicate_id}"
-                                    )
-                                    try:
-                                        self.run_logger.log(
-                                            "link",
-                                            "created",
-                                            s=instance_id,
-                                            p=predicate_id,
-                                            o=result_id,
-                                        )
-                                    except Exception:
-                                        pass
-                                else:
-                                    print(
-                                        f"  ⚠️ Failed to link to instance: {link_stmt.content if hasattr(link_stmt, 'content') else 'Unknown error'}"
-                                    )
-                                    print(
-                                        f"  ℹ️ Predicate {predicate_id} should already exist in ORKG"
-                                    )
-                            except Exception as e:
-                                print(f"  ⚠️ Error linking to instance: {e}")
-                                print(
-                                    f"  ℹ️ Predicate {predicate_id} should already exist in ORKG"
-                                )
+                            links.append((predicate_id, result_id, False))
                     else:
                         # empty_if_missing means leave property empty (no Not reported fallback)
                         mapping_key = predicate_info.get("resource_mapping_key")
                         if mapping_key and predicate_info.get("empty_if_missing"):
                             print(
-                                f"  ℹ️ {predicate_info.get('label', '')}: missing and configured as empty_if_missing; leaving empty"
+                                f"  ℹ️ {label}: missing and configured as empty_if_missing; leaving empty"
                             )
                             continue
                         # if the field has Not reported in resource mappings
                         self.add_not_reported(mapping_key, instance_id, predicate_id)
+
+            self.link_to_instance(instance_id, links)
+
             # Link paper to template instance if paper was found
             if paper_id:
                 self.link_paper_to_template(paper_id, instance_id)
@@ -1185,8 +1439,52 @@ class TemplateInstanceCreator:
             print(f"❌ Error creating instance: {e}")
             return None
 
+    def link_to_instance(
+        self, instance_id: str, links: List[Tuple[str, str, bool]]
+    ):
+        """Send the main instance's links together and report each outcome"""
+        if not links:
+            return
+        print(f"\n🔗 Linking {len(links)} value(s) to instance {instance_id}")
+        results = self.add_statements(
+            [(instance_id, predicate_id, object_id) for predicate_id, object_id, _ in links]
+        )
+        for (predicate_id, object_id, is_subtemplate), link_stmt in zip(links, results):
+            if isinstance(link_stmt, Exception):
+                print(f"  ⚠️ Error linking to instance: {link_stmt}")
+                print(f"  ℹ️ Predicate {predicate_id} should already exist in ORKG")
+            elif link_stmt.succeeded:
+                logger.debug(
+                    "  ✅ Linked %s to instance with predicate %s",
+                    "subtemplate" if is_subtemplate else object_id,
+                    predicate_id,
+                )
+                try:
+                    self.run_logger.log(
+                        "link",
+                        "created",
+                        s=instance_id,
+                        p=predicate_id,
+                        o=object_id,
+                    )
+                except Exception:
+                    pass
+            elif is_subtemplate:
+                print(f"  ⚠️ Failed to link subtemplate to instance")
+            else:
+                print(
+                    f"  ⚠️ Failed to link to instance: {link_stmt.content if hasattr(link_stmt, 'content') else 'Unknown error'}"
+                )
+                print(f"  ℹ️ Predicate {predicate_id} should already exist in ORKG")
+
     def process_json_file(self, json_file_path: str) -> Optional[str]:
         """Process a JSON file and create template instance"""
+        # A creator reused across files logs every file to a separate run log
+        if self.files_processed:
+            self.start_run()
+        self.files_processed += 1
+        refresh_auth(self.orkg)
+
         print(f"{'='*60}")
         print(f"PROCESSING: {json_file_path}")
         print(f"{'='*60}")
@@ -1198,13 +1496,76 @@ class TemplateInstanceCreator:
         return self.create_template_instance(json_data)
 
 
+def create(
+    json_file_path: str, creator: Optional[TemplateInstanceCreator] = None
+) -> Optional[str]:
+    """Create a template instance from a JSON file and return its ID.
+
+    Pass an existing creator to reuse its run state across files; the ORKG
+    client is reused per thread either way.
+    """
+    if creator is not None:
+        return creator.process_json_file(json_file_path)
+    creator = TemplateInstanceCreator()
+    try:
+        return creator.process_json_file(json_file_path)
+    finally:
+        creator.close()
+
+
+def create_many(
+    json_file_paths: List[str], max_workers: int = CREATE_WORKERS
+) -> List[Optional[str]]:
+    """Create template instances for several JSON files concurrently, in input order.
+
+    A creator holds per-file state (its run log, literal cache and cache
+    connection), so each worker thread reuses its own creator for the files
+    it handles.
+    """
+    workers = threading.local()
+    creators = []
+
+    def create_one(json_file_path: str) -> Optional[str]:
+        if not hasattr(workers, "creator"):
+            workers.creator = TemplateInstanceCreator()
+            creators.append(workers.creator)
+        return create(json_file_path, workers.creator)
+
+    max_workers = max(1, min(max_workers, len(json_file_paths)))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(create_one, json_file_paths))
+    finally:
+        for creator in creators:
+            creator.close()
+
+
 def main():
     """Main function"""
-    creator = TemplateInstanceCreator()
+    # Per-answer details are logged at DEBUG and stay quiet here
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
-    input_json_file = input("Please enter the path to the JSON file: ")
+    input_path = input("Please enter the path to the JSON file or folder: ")
 
-    instance_id = creator.process_json_file(input_json_file)
+    # A folder (e.g. pdf2JSON_Results) creates one instance per JSON file
+    if os.path.isdir(input_path):
+        json_files = sorted(
+            entry.path
+            for entry in os.scandir(input_path)
+            if entry.name.lower().endswith(".json") and entry.is_file()
+        )
+        if not json_files:
+            print(f"\n❌ No JSON files found in {input_path}")
+            return
+        instance_ids = create_many(json_files)
+        created = sum(1 for instance_id in instance_ids if instance_id)
+        print(f"\n📊 Created {created}/{len(json_files)} instances")
+        for json_file, instance_id in zip(json_files, instance_ids):
+            status = instance_id or "FAILED"
+            print(f"  {os.path.basename(json_file)}: {status}")
+        return
+
+    instance_id = create(input_path)
 
     if instance_id:
         print(f"\n🎉 SUCCESS! Instance ID: {instance_id}")
@@ -2,31 +2,48 @@
 # -*- coding: utf-8 -*-
 
 import json
+import os
 from pathlib import Path
+from typing import Optional, Tuple
 from scripts.PDFFormExtractor import PDFFormExtractor
 
 
+def extract_to_json(pdf_file_path: str) -> Tuple[dict, Optional[Path]]:
+    """Extract the form data of a PDF and save it as JSON next to the PDF"""
+    extractor = PDFFormExtractor(pdf_file_path)
+    data = extractor.extract_with_labels()
 
-def main():
-    try:
-        pdf_file_path = input("Please enter the path to an interactive PDF form: ")
+    if not data:
+        print("Could not extract any interactive form data. The PDF might be 'flat'.")
+        return data, None
 
-        extractor = PDFFormExtractor(pdf_file_path)
-        data = extractor.extract_with_labels()
+    json_output = extractor.to_json()
 
-        if not data:
-            print(
-                "Could not extract any interactive form data. The PDF might be 'flat'."
-            )
-            return
+    output_filename = extractor.pdf_path.with_suffix(".json")
+    # Write to a temporary file first, so a crash or timeout never leaves a
+    # truncated JSON that a resumed batch would take as converted
+    tmp_filename = output_filename.with_suffix(".json.tmp")
+    with open(tmp_filename, "w", encoding="utf-8") as f:
+        f.write(json_output)
+    os.replace(tmp_filename, output_filename)
+
+    print(f"\n✅ Successfully extracted data. Output saved to '{output_filename}'")
+    return data, output_filename
 
-        json_output = extractor.to_json()
 
-        output_filename = extractor.pdf_path.with_suffix(".json")
-        with open(output_filename, "w", encoding="utf-8") as f:
-            f.write(json_output)
+def convert(pdf_file_path: str) -> Optional[Path]:
+    """Convert a PDF form to JSON and return the path of the JSON file"""
+    _, output_filename = extract_to_json(pdf_file_path)
+    return output_filename
 
-        print(f"\n✅ Successfully extracted data. Output saved to '{output_filename}'")
+
+def main():
+    try:
+        pdf_file_path = input("Please enter the path to an interactive PDF form: ")
+
+        data, output_filename = extract_to_json(pdf_file_path)
+        if output_filename is None:
+            return
 
         # Show summary
         if "total_questions" in data:
@@ -0,0 +1,57 @@
+import os
+import sqlite3
+from typing import Optional
+
+
+class ORKGCache:
+    """Persistent store of ORKG objects created by earlier runs.
+    Maps (host, kind, key, label) to the ID returned by ORKG, so reruns can
+    reuse literals and 'Other' resources instead of creating them again.
+    """
+
+    def __init__(self, host: str, base_dir: str):
+        self.host = host
+        self.cache_dir = os.path.join(base_dir, ".cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.db_path = os.path.join(self.cache_dir, "orkg_objects.db")
+        # Autocommit; every batch worker opens its own connection, and WAL
+        # lets them read while another one writes. A connection is only used by
+        # one thread at a time, but may be closed from the thread that started
+        # the workers once they are done.
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            "host TEXT, kind TEXT, key TEXT, label TEXT, object_id TEXT, "
+            "PRIMARY KEY (host, kind, key, label))"
+        )
+
+    def get(self, kind: str, key: str, label: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT object_id FROM objects "
+            "WHERE host = ? AND kind = ? AND key = ? AND label = ?",
+            (self.host, kind, key, label),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, kind: str, key: str, label: str, object_id: str):
+        self._conn.execute(
+            "INSERT OR IGNORE INTO objects VALUES (?, ?, ?, ?, ?)",
+            (self.host, kind, key, label, object_id),
+        )
+
+    def forget(self, kind: str, key: str, label: str):
+        """Drop an entry whose object no longer exists in ORKG"""
+        self._conn.execute(
+            "DELETE FROM objects "
+            "WHERE host = ? AND kind = ? AND key = ? AND label = ?",
+            (self.host, kind, key, label),
+        )
+
+    def close(self):
+        try:
+            self._conn.close()
+        except Exception:
+            pass
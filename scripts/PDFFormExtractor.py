@@ -7,6 +7,9 @@ from pathlib import Path
 # Import mappings for better field label extraction
 from .mappings import resource_mappings, predicates_mapping, class_mappings
 
+# Leading question code such as 'II.1' in a question text
+QUESTION_CODE_RE = re.compile(r"^\s*([IVXLCDM]+\.[0-9]+)")
+
 
 class PDFFormExtractor:
     """
@@ -28,6 +31,20 @@ class PDFFormExtractor:
         # Precompute an index from question_mapping tokens (e.g., 'II.1') to resource_mapping_key
         self._question_mapping_index = self._build_question_mapping_index()
 
+        # Lowercase mapping labels and predicate descriptions once, instead of
+        # on every comparison while matching labels and questions
+        self._lowered_mapping_labels = {
+            category: [(mapped_label, mapped_label.lower()) for mapped_label in mappings]
+            for category, mappings in (self.resource_mappings or {}).items()
+        }
+        self._lowered_descriptions = [
+            (
+                (predicate_info.get("description", "") or "").lower(),
+                predicate_info.get("resource_mapping_key"),
+            )
+            for predicate_info in self._iter_predicates()
+        ]
+
         # logging setup
         self.debug = debug
         self.logger = logging.getLogger(__name__ + ".PDFFormExtractor")
@@ -599,16 +616,17 @@ class PDFFormExtractor:
 
         # Build iterable of categories to search (restricted if resource_key provided)
         categories_to_search = (
-            [(resource_key, self.resource_mappings.get(resource_key, {}))]
+            [(resource_key, self._lowered_mapping_labels.get(resource_key, []))]
             if resource_key
-            else list(self.resource_mappings.items())
+            else list(self._lowered_mapping_labels.items())
         )
+        clean_lower = clean_label.lower()
 
         # Try to find a matching mapping key for this label within allowed categories
         for mapping_category, mappings in categories_to_search:
             # Direct match (case-insensitive)
-            for mapped_label in mappings.keys():
-                if clean_label.lower() == mapped_label.lower():
+            for mapped_label, mapped_lower in mappings:
+                if clean_lower == mapped_lower:
                     if self.debug:
                         self.logger.debug(
                             "Found direct mapping for '%s' -> '%s' in category '%s'",
@@ -619,9 +637,9 @@ class PDFFormExtractor:
                     return mapped_label
 
             # Partial match - look for labels that start with our extracted text (case-insensitive)
-            for mapped_label in mappings.keys():
+            for mapped_label, mapped_lower in mappings:
                 if (
-                    mapped_label.lower().startswith(clean_label.lower())
+                    mapped_lower.startswith(clean_lower)
                     and len(clean_label) > 3
                 ):
                     if self.debug:
@@ -634,9 +652,9 @@ class PDFFormExtractor:
                     return mapped_label
 
             # Reverse partial match - check if our extracted text starts with a mapped label
-            for mapped_label in mappings.keys():
+            for mapped_label, mapped_lower in mappings:
                 if (
-                    clean_label.lower().startswith(mapped_label.lower())
+                    clean_lower.startswith(mapped_lower)
                     and len(mapped_label) > 5
                 ):
                     if self.debug:
@@ -649,10 +667,10 @@ class PDFFormExtractor:
                     return mapped_label
 
             # Fuzzy match for common truncation patterns (case-insensitive)
-            for mapped_label in mappings.keys():
+            for mapped_label, mapped_lower in mappings:
                 # Check if our label is a truncated version of a mapped label
                 if (
-                    clean_label.lower() in mapped_label.lower()
+                    clean_lower in mapped_lower
                     and len(clean_label) > 5
                     and abs(len(mapped_label) - len(clean_label)) < 20
                 ):
@@ -796,7 +814,7 @@ class PDFFormExtractor:
             return None
 
         # First pass: extract leading token like 'II.1'
-        m = re.match(r"^\s*([IVXLCDM]+\.[0-9]+)", question_text)
+        m = QUESTION_CODE_RE.match(question_text)
         if m:
             token = m.group(1)
             rkey = self._question_mapping_index.get(token)
@@ -810,10 +828,8 @@ class PDFFormExtractor:
 
         # Third pass: match by description text across all predicates
         lowered_q = question_text.lower()
-        for predicate_info in self._iter_predicates():
-            desc = (predicate_info or {}).get("description", "").lower()
+        for desc, rkey in self._lowered_descriptions:
             if desc and (desc in lowered_q or (desc[:25] and desc[:25] in lowered_q)):
-                rkey = predicate_info.get("resource_mapping_key")
                 if rkey in (self.resource_mappings or {}):
                     return rkey
 
@@ -847,7 +863,7 @@ class PDFFormExtractor:
             return options
 
         # Try resolving by leading token like 'II.1'
-        m = re.match(r"^\s*([IVXLCDM]+\.[0-9]+)", question_text)
+        m = QUESTION_CODE_RE.match(question_text)
         if m:
             token = m.group(1)
             rkey = self._question_mapping_index.get(token)
@@ -864,10 +880,8 @@ class PDFFormExtractor:
 
         # Fallback: Try to match question text to predicate mappings by description across all levels
         lowered_q = question_text.lower()
-        for predicate_info in self._iter_predicates():
-            desc = (predicate_info.get("description", "") or "").lower()
+        for desc, r_key in self._lowered_descriptions:
             if desc and desc in lowered_q:
-                r_key = predicate_info.get("resource_mapping_key")
                 if r_key and r_key in self.resource_mappings:
                     options = list(self.resource_mappings[r_key].keys())
                     if self.debug: